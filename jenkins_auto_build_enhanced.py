@@ -5,16 +5,48 @@ Jenkins 自动化构建脚本 - 增强版
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
 import sys
 import argparse
 import os
+import re
 from urllib.parse import urljoin
 import base64
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 from datetime import datetime
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+# Jenkins 元数据（crumb）的本机缓存目录和有效期
+_META_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'jenkins_auto_build')
+_META_CACHE_TTL = 300  # 秒
+
+
+@lru_cache(maxsize=None)
+def _read_config_file(config_file, mtime):
+    """
+    读取并解析配置文件，按 (路径, 修改时间) 缓存
+
+    同一配置文件未修改时重复构建实例（测试、--dry-run）无需重新解析
+
+    Args:
+        config_file: 配置文件路径
+        mtime: 文件修改时间，作为缓存失效依据
+
+    Returns:
+        dict: 解析后的配置信息
+    """
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 class JenkinsAutoBuildEnhanced:
     def __init__(self, config_file='jenkins_config.json'):
@@ -25,8 +57,21 @@ class JenkinsAutoBuildEnhanced:
             config_file: 配置文件路径
         """
         self.config = self.load_config(config_file)
+
+        # 预先计算热路径频繁使用的配置项，轮询循环中只做一次属性读取
+        self._base_url = self.config['jenkins_url'].rstrip('/')
+        build_config = self.config.get('build_config', {})
+        self._timeout = build_config.get('timeout_seconds', 1800)
+        self._check_interval = build_config.get('check_interval_seconds', 30)
+
         self.session = requests.Session()
-        
+
+        # 显式设置连接池大小，复用长连接，避免每次轮询都重新握手；
+        # pool_maxsize 需容纳并行模式下触发、轮询、停止同时在飞的请求
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=0))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # 设置认证
         auth_string = f"{self.config['username']}:{self.config['password_or_token']}"
         encoded_auth = base64.b64encode(auth_string.encode()).decode()
@@ -37,16 +82,29 @@ class JenkinsAutoBuildEnhanced:
         # 设置日志记录器
         self.setup_logger()
         
-        # 跟踪当前运行的任务
-        self.current_job = None
-        self.current_build_number = None
+        # 跟踪当前运行的任务（并行模式下可能同时有多个）
+        self._running_builds = {}
+
+        # 状态接口的 ETag 缓存: url -> (etag, 上次的JSON)，用于条件GET
+        self._status_cache = {}
+
+        # 中断标志: 信号处理器只置位，真正的中断逻辑由主流程执行
+        self._interrupt_evt = threading.Event()
         
         # 设置信号处理器
         self.setup_signal_handlers()
         
-        # 获取 CSRF token (crumb)
-        self.crumb = self.get_crumb()
-        
+        # 获取 CSRF token (crumb)，作为会话级请求头安装，后续请求无需逐个构造
+        # 服务器未启用CSRF保护时直接跳过 /crumbIssuer 请求；
+        # 短时间内重复运行（--test/--dry-run）直接复用本机缓存，不走网络
+        meta = self._load_cached_meta()
+        if meta is not None and 'crumb' in meta:
+            self.crumb = meta['crumb']
+        else:
+            self.crumb = self.get_crumb() if self._crumb_needed() else None
+            self._save_cached_meta({'crumb': self.crumb})
+        self._install_crumb_header()
+
     def setup_logger(self):
         """
         设置日志记录器，同时输出到控制台和文件
@@ -64,32 +122,51 @@ class JenkinsAutoBuildEnhanced:
         # 控制台处理器
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # 文件处理器
-        file_handler = logging.FileHandler('run.log', mode='a', encoding='utf-8')
+
+        # 文件处理器（delay=True: 首次写入时才打开文件）
+        file_handler = logging.FileHandler('run.log', mode='a', encoding='utf-8', delay=True)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        
+
+        # 日志先进内存队列，由后台线程写控制台和文件，
+        # 轮询热路径上的 log() 调用不再被磁盘 I/O 阻塞
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(log_queue, console_handler, file_handler)
+        self._log_listener.start()
+        atexit.register(self._stop_log_listener)
+
         # 防止日志重复
         self.logger.propagate = False
+
+    def _stop_log_listener(self):
+        """
+        停止日志后台线程并刷出剩余日志（可重复调用）
+        """
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
         
-    def log(self, message):
+    def log(self, message, *args):
         """
         统一的日志输出方法
-        
+
         Args:
-            message: 要输出的消息
+            message: 要输出的消息，可带 %s 占位符
+            *args: 占位符参数，由 logging 惰性格式化
         """
-        self.logger.info(message)
+        self.logger.info(message, *args)
         
     def setup_signal_handlers(self):
         """
         设置信号处理器
+
+        处理器只置位事件标志后立即返回，真正的中断逻辑（可能阻塞在
+        input() 和 HTTP 请求上）由主流程在轮询间隙执行，
+        避免在信号帧里做阻塞 I/O
         """
         def signal_handler(signum, frame):
-            self.handle_interrupt()
-        
+            self._interrupt_evt.set()
+
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
@@ -98,20 +175,22 @@ class JenkinsAutoBuildEnhanced:
         处理中断信号
         """
         self.log("\n🛑 检测到中断信号...")
-        
-        if self.current_job and self.current_build_number:
-            self.log(f"当前正在运行: {self.current_job} #{self.current_build_number}")
-            
+
+        if self._running_builds:
+            for job_name, build_number in self._running_builds.items():
+                self.log(f"当前正在运行: {job_name} #{build_number}")
+
             try:
                 # 询问用户是否要停止当前构建
                 while True:
                     choice = input("\n是否要停止当前正在运行的Jenkins任务? (y/n): ").strip().lower()
                     if choice in ['y', 'yes', '是']:
-                        self.log(f"正在停止任务: {self.current_job} #{self.current_build_number}")
-                        if self.stop_build(self.current_job, self.current_build_number):
-                            self.log("✅ 任务已成功停止")
-                        else:
-                            self.log("❌ 停止任务失败")
+                        for job_name, build_number in list(self._running_builds.items()):
+                            self.log(f"正在停止任务: {job_name} #{build_number}")
+                            if self.stop_build(job_name, build_number):
+                                self.log("✅ 任务已成功停止")
+                            else:
+                                self.log("❌ 停止任务失败")
                         break
                     elif choice in ['n', 'no', '否']:
                         self.log("保留Jenkins任务继续运行")
@@ -122,8 +201,126 @@ class JenkinsAutoBuildEnhanced:
                 self.log("无法获取用户输入，保留Jenkins任务继续运行")
         
         self.log("程序退出")
+        self._stop_log_listener()
         sys.exit(1)
         
+    @staticmethod
+    def _read_snippet(response, limit=4096):
+        """
+        只读取响应体开头部分并关闭连接
+
+        避免为了记录日志片段而把整个响应（可能是很大的HTML错误页）载入内存
+
+        Args:
+            response: stream=True 发起的HTTP响应对象
+            limit: 最多读取的字节数
+
+        Returns:
+            str: 解码后的响应片段
+        """
+        try:
+            return response.raw.read(limit, decode_content=True).decode('utf-8', 'replace')
+        finally:
+            response.close()
+
+    def _meta_cache_path(self):
+        """
+        返回当前 Jenkins 地址对应的元数据缓存文件路径
+        """
+        host = re.sub(r'[^A-Za-z0-9._-]+', '_', self._base_url.split('://', 1)[-1])
+        return os.path.join(_META_CACHE_DIR, f"{host}.json")
+
+    def _load_cached_meta(self):
+        """
+        读取本机缓存的 Jenkins 元数据
+
+        Returns:
+            dict: 缓存内容，不存在或超过TTL时返回None
+        """
+        try:
+            path = self._meta_cache_path()
+            if time.time() - os.path.getmtime(path) < _META_CACHE_TTL:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception:
+            pass
+        return None
+
+    def _save_cached_meta(self, meta):
+        """
+        将 Jenkins 元数据写入本机缓存（失败不影响主流程）
+
+        Args:
+            meta: 要缓存的字典
+        """
+        try:
+            os.makedirs(_META_CACHE_DIR, exist_ok=True)
+            with open(self._meta_cache_path(), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except Exception:
+            pass
+
+    def _drop_cached_meta(self):
+        """
+        删除本机缓存的 Jenkins 元数据（crumb 失效时调用）
+        """
+        try:
+            os.remove(self._meta_cache_path())
+        except OSError:
+            pass
+
+    def _crumb_needed(self):
+        """
+        判断是否需要获取 crumb
+
+        优先看配置开关 csrf_enabled；未配置时用一次轻量的
+        ?tree=useCrumbs 探测，CSRF 关闭的服务器省掉 crumbIssuer
+        往返和对应的 404 告警日志
+
+        Returns:
+            bool: 是否需要获取 crumb
+        """
+        if 'csrf_enabled' in self.config:
+            if not self.config['csrf_enabled']:
+                self.log("CSRF 保护已在配置中关闭，跳过 crumb 获取")
+                return False
+            return True
+
+        try:
+            response = self.session.get(f"{self._base_url}/api/json?tree=useCrumbs", timeout=10)
+            if response.status_code == 200:
+                if not response.json().get('useCrumbs', True):
+                    self.log("Jenkins 未启用CSRF保护，跳过 crumb 获取")
+                    return False
+        except Exception:
+            pass
+
+        # 探测失败时保守处理，仍然尝试获取 crumb
+        return True
+
+    def _install_crumb_header(self):
+        """
+        将 crumb 安装到会话请求头中
+        """
+        if self.crumb:
+            self.session.headers[self.crumb['crumbRequestField']] = self.crumb['crumb']
+
+    def refresh_crumb(self):
+        """
+        重新获取 crumb 并更新会话请求头（crumb 过期返回 403 时调用）
+
+        Returns:
+            bool: 是否成功刷新
+        """
+        self._drop_cached_meta()
+        if self.crumb:
+            self.session.headers.pop(self.crumb['crumbRequestField'], None)
+
+        self.crumb = self.get_crumb()
+        self._install_crumb_header()
+        self._save_cached_meta({'crumb': self.crumb})
+        return self.crumb is not None
+
     def stop_build(self, job_name, build_number):
         """
         停止指定的构建
@@ -136,22 +333,27 @@ class JenkinsAutoBuildEnhanced:
             bool: 是否成功停止
         """
         try:
-            jenkins_url = self.config['jenkins_url'].rstrip('/')
-            url = f"{jenkins_url}/job/{job_name}/{build_number}/stop"
-            
-            # 准备请求头
-            headers = {}
-            if self.crumb:
-                headers[self.crumb['crumbRequestField']] = self.crumb['crumb']
-            
-            response = self.session.post(url, headers=headers)
-            
+            url = f"{self._base_url}/job/{job_name}/{build_number}/stop"
+
+            response = self.session.post(url, stream=True)
+
             if response.status_code in [200, 201, 302]:  # 302也是成功的重定向
+                response.close()
                 return True
-            else:
-                self.log(f"停止构建失败，状态码: {response.status_code}")
-                self.log(f"响应内容: {response.text}")
-                return False
+
+            snippet = self._read_snippet(response)
+            if response.status_code == 403 and 'No valid crumb' in snippet:
+                self.log("⚠️  crumb 已失效，重新获取后重试")
+                if self.refresh_crumb():
+                    response = self.session.post(url, stream=True)
+                    if response.status_code in [200, 201, 302]:
+                        response.close()
+                        return True
+                    snippet = self._read_snippet(response)
+
+            self.log("停止构建失败，状态码: %s", response.status_code)
+            self.log("响应内容: %s", snippet[:200])
+            return False
                 
         except Exception as e:
             self.log(f"停止构建异常: {str(e)}")
@@ -165,8 +367,7 @@ class JenkinsAutoBuildEnhanced:
             dict: 包含crumb信息的字典，如果获取失败则返回None
         """
         try:
-            jenkins_url = self.config['jenkins_url'].rstrip('/')
-            crumb_url = f"{jenkins_url}/crumbIssuer/api/json"
+            crumb_url = f"{self._base_url}/crumbIssuer/api/json"
             
             response = self.session.get(crumb_url)
             
@@ -200,9 +401,8 @@ class JenkinsAutoBuildEnhanced:
             sys.exit(1)
             
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
+            config = _read_config_file(config_file, os.path.getmtime(config_file))
+
             # 验证必要的配置项
             required_fields = ['jenkins_url', 'username', 'password_or_token']
             for field in required_fields:
@@ -239,18 +439,13 @@ class JenkinsAutoBuildEnhanced:
         """
         try:
             branch = branch or self.config.get('branch', 'master')
-            
-            # 构建 URL
-            jenkins_url = self.config['jenkins_url'].rstrip('/')
-            
+
             # 准备请求头
-            headers = {}
             if self.crumb:
-                headers[self.crumb['crumbRequestField']] = self.crumb['crumb']
                 self.log(f"🔒 使用 CSRF token: {self.crumb['crumbRequestField']}")
-            
+
             # 总是使用带参数的构建，因为Jenkins任务需要BRANCH参数
-            url = f"{jenkins_url}/job/{job_name}/buildWithParameters"
+            url = f"{self._base_url}/job/{job_name}/buildWithParameters"
             build_params = {"BRANCH": branch}
             
             # 如果有额外参数，添加到构建参数中
@@ -262,8 +457,14 @@ class JenkinsAutoBuildEnhanced:
                 self.log(f"正在触发构建: {job_name} (分支: {branch})")
                 self.log(f"构建参数: {build_params}")
                 
-            response = self.session.post(url, data=build_params, headers=headers)
-            
+            response = self.session.post(url, data=build_params)
+
+            if response.status_code == 403 and 'No valid crumb' in response.text:
+                self.log("⚠️  crumb 已失效，重新获取后重试")
+                if self.refresh_crumb():
+                    response = self.session.post(url, data=build_params)
+
+
             self.log(f"构建 URL: {url}")
             
             if response.status_code in [200, 201]:
@@ -307,15 +508,23 @@ class JenkinsAutoBuildEnhanced:
             
             self.log(f"📍 队列位置: {location}")
             
-            # 轮询队列直到获取构建号
-            jenkins_url = self.config['jenkins_url'].rstrip('/')
-            queue_url = location
-            if not queue_url.startswith('http'):
-                queue_url = f"{jenkins_url}{location}" if location.startswith('/') else f"{jenkins_url}/{location}"
-            
-            queue_api_url = f"{queue_url}api/json"
-            
-            for attempt in range(30):  # 最多等待30次，每次2秒
+            # Location 形如 .../queue/item/1234/，取出队列项ID一次性拼好API地址
+            # 只取构建号和取消状态，不拉取完整的队列项 JSON
+            match = re.search(r'/queue/item/(\d+)/', location)
+            if match:
+                queue_api_url = f"{self._base_url}/queue/item/{match.group(1)}/api/json?tree=executable[number],cancelled,why"
+            else:
+                queue_url = location
+                if not queue_url.startswith('http'):
+                    queue_url = f"{self._base_url}{location}" if location.startswith('/') else f"{self._base_url}/{location}"
+                queue_api_url = f"{queue_url}api/json?tree=executable[number],cancelled,why"
+
+            # 自适应退避: 队列立即分配时一两次往返即可返回，不用固定等2秒
+            delay = 0.2
+            for attempt in range(30):
+                if self._interrupt_evt.is_set():
+                    self.handle_interrupt()
+                    return None
                 try:
                     queue_response = self.session.get(queue_api_url)
                     if queue_response.status_code == 200:
@@ -333,8 +542,9 @@ class JenkinsAutoBuildEnhanced:
                             self.log(f"❌ 构建被取消")
                             return None
                         
-                        self.log(f"⏳ 等待队列分配构建号... (尝试 {attempt + 1}/30)")
-                        time.sleep(2)
+                        self.log("⏳ 等待队列分配构建号... (尝试 %s/30)", attempt + 1)
+                        self._interrupt_evt.wait(delay)
+                        delay = min(2.0, delay * 2)
                     else:
                         self.log(f"⚠️  队列API调用失败，状态码: {queue_response.status_code}")
                         break
@@ -362,17 +572,27 @@ class JenkinsAutoBuildEnhanced:
             dict: 任务状态信息
         """
         try:
-            jenkins_url = self.config['jenkins_url'].rstrip('/')
-            
+            # tree= 让 Jenkins 只序列化需要的字段，避免传输完整的变更记录和日志
             if build_number and build_number != -1:
-                url = f"{jenkins_url}/job/{job_name}/{build_number}/api/json"
+                url = f"{self._base_url}/job/{job_name}/{build_number}/api/json?tree=result,building,number,url"
             else:
-                url = f"{jenkins_url}/job/{job_name}/lastBuild/api/json"
-            
-            response = self.session.get(url)
+                url = f"{self._base_url}/job/{job_name}/lastBuild/api/json?tree=result,building,number,url"
             
+            # 带上 If-None-Match，状态未变化时 Jenkins 返回 304 空响应体
+            cached = self._status_cache.get(url)
+            headers = {'If-None-Match': cached[0]} if cached else None
+
+            response = self.session.get(url, headers=headers)
+
+            if response.status_code == 304:
+                return cached[1]
+
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._status_cache[url] = (etag, data)
+                return data
             else:
                 self.log(f"⚠️ 获取任务状态失败: {job_name}, 状态码: {response.status_code}")
                 return None
@@ -381,6 +601,97 @@ class JenkinsAutoBuildEnhanced:
             self.log(f"❌ 获取任务状态异常: {job_name}, 错误: {str(e)}")
             return None
     
+    def get_all_jobs_status(self, names):
+        """
+        批量获取多个任务的最新构建状态（一次HTTP请求）
+
+        Args:
+            names: 任务名称集合
+
+        Returns:
+            dict: 任务名 -> lastBuild 状态字典（可能为None）
+        """
+        try:
+            url = f"{self._base_url}/api/json?tree=jobs[name,lastBuild[number,result,building,url]]"
+            response = self.session.get(url)
+
+            if response.status_code != 200:
+                self.log("⚠️ 批量获取任务状态失败, 状态码: %s", response.status_code)
+                return {}
+
+            names = set(names)
+            data = response.json()
+            return {job['name']: job.get('lastBuild') for job in data.get('jobs', []) if job['name'] in names}
+
+        except Exception as e:
+            self.log("❌ 批量获取任务状态异常: %s", str(e))
+            return {}
+
+    def _wait_for_all_builds(self, builds):
+        """
+        并行模式的等待阶段
+
+        每个轮询周期只发一次批量查询，再把结果分发给各个任务，
+        而不是每个任务各自轮询一次
+
+        Args:
+            builds: 任务名 -> 构建号 的字典
+
+        Returns:
+            bool: 是否全部构建成功
+        """
+        timeout = self._timeout
+        check_interval = self._check_interval
+
+        self.log(f"等待 {len(builds)} 个任务完成 (超时: {timeout}秒)")
+        start_time = time.time()
+
+        pending = dict(builds)
+        results = {}
+        backoff = 1
+
+        while pending and time.time() - start_time < timeout:
+            if self._interrupt_evt.is_set():
+                self.handle_interrupt()
+                return False
+
+            shared_status = self.get_all_jobs_status(pending.keys())
+
+            for job_name, build_number in list(pending.items()):
+                status = shared_status.get(job_name)
+                if not status:
+                    continue
+
+                # 批量接口返回的是 lastBuild，确认就是我们触发的那次构建
+                if build_number and build_number != -1 and status.get('number') != build_number:
+                    status = self.get_job_status(job_name, build_number)
+                    if not status:
+                        continue
+
+                if not status.get('building') and status.get('result'):
+                    success = status['result'] == 'SUCCESS'
+                    if success:
+                        self.log("✅ 构建成功: %s #%s", job_name, status.get('number'))
+                    else:
+                        self.log("❌ 构建失败: %s #%s, 结果: %s", job_name, status.get('number'), status['result'])
+                        if status.get('url'):
+                            self.log("构建详情: %s", status['url'])
+                    results[job_name] = success
+                    del pending[job_name]
+                    self._running_builds.pop(job_name, None)
+                    backoff = 1
+
+            if pending:
+                elapsed = int(time.time() - start_time)
+                self.log("⏳ 仍有 %s 个任务在构建中 (已用时: %s秒)", len(pending), elapsed)
+                self._interrupt_evt.wait(min(check_interval, backoff))
+                backoff = min(check_interval, backoff * 2)
+
+        for job_name, build_number in pending.items():
+            self.log("❌ 构建超时: %s #%s", job_name, build_number)
+
+        return not pending and all(results.values())
+
     def wait_for_build_completion(self, job_name, build_number=None):
         """
         等待构建完成
@@ -392,20 +703,32 @@ class JenkinsAutoBuildEnhanced:
         Returns:
             bool: 构建是否成功
         """
-        build_config = self.config.get('build_config', {})
-        timeout = build_config.get('timeout_seconds', 1800)
-        check_interval = build_config.get('check_interval_seconds', 30)
-        
+        timeout = self._timeout
+        check_interval = self._check_interval
+
         build_desc = f"{job_name} #{build_number}" if build_number and build_number != -1 else f"{job_name} (最新)"
         self.log(f"等待构建完成: {build_desc} (超时: {timeout}秒)")
         start_time = time.time()
-        
+
+        # 指数退避: 短构建快速发现完成，长构建逐步退到 check_interval
+        backoff = 1
+        last_building = None
+
         while time.time() - start_time < timeout:
+            if self._interrupt_evt.is_set():
+                self.handle_interrupt()
+                return False
+
             status = self.get_job_status(job_name, build_number)
-            
+
             if status:
                 result = status.get('result')
                 building = status.get('building', False)
+
+                # 状态发生跳变时重置退避，尽快跟进新状态
+                if building != last_building:
+                    backoff = 1
+                    last_building = building
                 actual_build_number = status.get('number', 'N/A')
                 
                 # 如果我们指定了构建号，验证返回的是正确的构建
@@ -424,10 +747,11 @@ class JenkinsAutoBuildEnhanced:
                         return False
                 else:
                     elapsed = int(time.time() - start_time)
-                    self.log(f"⏳ 构建进行中: {job_name} #{actual_build_number} (已用时: {elapsed}秒)")
-            
-            time.sleep(check_interval)
-        
+                    self.log("⏳ 构建进行中: %s #%s (已用时: %s秒)", job_name, actual_build_number, elapsed)
+
+            self._interrupt_evt.wait(min(check_interval, backoff))
+            backoff = min(check_interval, backoff * 2)
+
         self.log(f"❌ 构建超时: {build_desc}")
         return False
     
@@ -452,33 +776,42 @@ class JenkinsAutoBuildEnhanced:
         self.log(f"配置: 最大尝试 {max_attempts} 次，间隔 {interval} 秒，期望状态码 {expected_status}")
         
         for attempt in range(1, max_attempts + 1):
+            if self._interrupt_evt.is_set():
+                self.handle_interrupt()
+                return False
+
             try:
-                self.log(f"第 {attempt}/{max_attempts} 次尝试...")
-                
-                response = requests.get(interface_url, timeout=10)
-                
-                self.log(f"响应状态码: {response.status_code}")
-                
+                self.log("第 %s/%s 次尝试...", attempt, max_attempts)
+
+                response = self.session.get(interface_url, timeout=10, stream=True)
+
+                self.log("响应状态码: %s", response.status_code)
+
                 if response.status_code == expected_status:
-                    self.log(f"✅ 接口调用成功!")
+                    self.log("✅ 接口调用成功!")
                     try:
-                        # 尝试解析 JSON 响应
+                        # 尝试解析 JSON 响应，完整内容只在 DEBUG 级别格式化输出
                         json_response = response.json()
-                        self.log(f"响应内容: {json.dumps(json_response, indent=2, ensure_ascii=False)}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("响应内容: %s", json.dumps(json_response, indent=2, ensure_ascii=False))
                     except:
-                        self.log(f"响应内容: {response.text[:200]}...")
+                        self.log("响应内容: %s...", response.text[:200])
+                    finally:
+                        response.close()
                     return True
                 else:
-                    self.log(f"⏳ 接口调用失败, 状态码: {response.status_code}")
-                    if response.text:
-                        self.log(f"响应内容: {response.text[:200]}...")
-                    
+                    # 失败响应可能是很大的HTML错误页，只读开头片段
+                    snippet = self._read_snippet(response)
+                    self.log("⏳ 接口调用失败, 状态码: %s", response.status_code)
+                    if snippet:
+                        self.log("响应内容: %s...", snippet[:200])
+
             except Exception as e:
-                self.log(f"⏳ 接口调用异常: {str(e)}")
-            
+                self.log("⏳ 接口调用异常: %s", str(e))
+
             if attempt < max_attempts:
-                self.log(f"等待 {interval} 秒后重试...")
-                time.sleep(interval)
+                self.log("等待 %s 秒后重试...", interval)
+                self._interrupt_evt.wait(interval)
         
         self.log(f"❌ 接口轮询失败，已达到最大尝试次数: {max_attempts}")
         return False
@@ -527,6 +860,38 @@ class JenkinsAutoBuildEnhanced:
         
         return jobs
 
+    def _build_and_wait(self, job, branch):
+        """
+        触发单个任务并等待其完成（顺序模式）
+
+        Args:
+            job: 任务字典，包含 name, description, parameters
+            branch: 分支名称
+
+        Returns:
+            bool: 构建是否成功
+        """
+        job_name = job['name']
+        job_params = job['parameters']
+
+        build_number = self.trigger_build(job_name, branch, job_params if job_params else None)
+        if build_number is None:
+            self.log(f"❌ 任务 {job_name} 触发失败")
+            return False
+
+        # 更新当前运行任务跟踪
+        self._running_builds[job_name] = build_number
+        try:
+            if not self.wait_for_build_completion(job_name, build_number):
+                self.log(f"❌ 任务 {job_name} 构建失败")
+                return False
+        finally:
+            # 任务完成，清除跟踪
+            self._running_builds.pop(job_name, None)
+
+        self.log(f"✅ 任务 {job_name} 构建成功！")
+        return True
+
     def run_build_workflow(self):
         """
         运行完整的构建工作流
@@ -561,37 +926,48 @@ class JenkinsAutoBuildEnhanced:
         else:
             self.log(f"  模式: 直接构建模式（无需轮询外部接口）")
         self.log("=" * 60)
-        
-        # 循环执行所有任务
+
+        # 并行模式：任务之间相互独立时，同时触发所有任务，再统一批量轮询等待
+        if self.config.get('parallel_jobs', False) and len(jobs) > 1:
+            self.log(f"\n⚡ 并行模式: 同时触发 {len(jobs)} 个任务")
+            self.log("-" * 50)
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                build_numbers = list(executor.map(
+                    lambda job: self.trigger_build(job['name'], branch, job['parameters'] if job['parameters'] else None),
+                    jobs))
+
+            builds = {}
+            for job, build_number in zip(jobs, build_numbers):
+                if build_number is None:
+                    self.log(f"❌ 任务 {job['name']} 触发失败，流程失败")
+                    return False
+                builds[job['name']] = build_number
+                self._running_builds[job['name']] = build_number
+
+            if not self._wait_for_all_builds(builds):
+                self.log("❌ 部分任务构建失败，流程失败")
+                return False
+            self.log("\n" + "=" * 60)
+            self.log("🎉 所有任务完成!")
+            self.log("=" * 60)
+            return True
+
+        # 顺序模式：循环执行所有任务
         for i, job in enumerate(jobs):
+            if self._interrupt_evt.is_set():
+                self.handle_interrupt()
+                return False
+
             job_name = job['name']
             job_desc = job['description']
-            job_params = job['parameters']
-            
+
             self.log(f"\n📋 步骤{i+1}: 构建任务 [{job_name}] - {job_desc}")
             self.log("-" * 50)
-            
-            # 触发构建
-            build_number = self.trigger_build(job_name, branch, job_params if job_params else None)
-            if build_number is None:
-                self.log(f"❌ 任务 {job_name} 触发失败，终止流程")
-                return False
-            
-            # 更新当前运行任务跟踪
-            self.current_job = job_name
-            self.current_build_number = build_number
-            
-            # 等待任务完成
-            if not self.wait_for_build_completion(job_name, build_number):
-                self.log(f"❌ 任务 {job_name} 构建失败，终止流程")
+
+            if not self._build_and_wait(job, branch):
+                self.log(f"❌ 任务 {job_name} 失败，终止流程")
                 return False
-            
-            # 任务完成，清除跟踪
-            self.current_job = None
-            self.current_build_number = None
-            
-            self.log(f"✅ 任务 {job_name} 构建成功！")
-            
+
             # 如果不是最后一个任务，进行等待和可选的接口轮询
             if i < len(jobs) - 1:  # 不是最后一个任务
                 next_job = jobs[i + 1]
@@ -608,9 +984,7 @@ class JenkinsAutoBuildEnhanced:
                 if wait_time > 0:
                     self.log(f"\n⏰ 等待 {wait_time} 秒后开始下一个任务 [{next_job['name']}]...")
                     self.log("-" * 40)
-                    for remaining in range(wait_time, 0, -1):
-                        print(f"⏳ 倒计时: {remaining} 秒", end='\r')
-                        time.sleep(1)
+                    self._interrupt_evt.wait(wait_time)
                     self.log(f"✅ 等待完成，开始下一个任务!")
                 else:
                     self.log(f"\n🚀 立即开始下一个任务 [{next_job['name']}]...")
@@ -625,10 +999,9 @@ class JenkinsAutoBuildEnhanced:
         测试 Jenkins 连接
         """
         try:
-            jenkins_url = self.config['jenkins_url'].rstrip('/')
-            url = f"{jenkins_url}/api/json"
-            
-            self.log(f"测试 Jenkins 连接: {jenkins_url}")
+            url = f"{self._base_url}/api/json"
+
+            self.log(f"测试 Jenkins 连接: {self._base_url}")
             response = self.session.get(url)
             
             if response.status_code == 200: